@@ -1,20 +1,113 @@
 """CLI for contact crawler.
 
+Results are appended to the output file as JSON Lines, one object per URL,
+as each crawl finishes.
+
 Usage examples:
   python crawl.py https://example.com
-  python crawl.py --input urls.txt --output results/output.json
+  python crawl.py --input urls.txt --output results/output.jsonl
 """
 import argparse
-import json
-from src.contact_crawler import crawl_url
+import asyncio
+import multiprocessing
+import orjson
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from src.contact_crawler import crawl_url, crawl_url_async, make_session, DEFAULT_HEADERS
 from pathlib import Path
 
+try:
+    import httpx
+except ImportError:  # fall back to the thread pool below
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+    HTTP2 = True
+except ImportError:  # plain httpx still works over HTTP/1.1
+    HTTP2 = False
+
+
+async def crawl_all(urls, concurrency=20, timeout=15, executor=None):
+    # yields (url, result or exception) as each crawl finishes, with at most
+    # `concurrency` requests in flight at once. HTTP/2 lets requests to the
+    # same host share one connection; over HTTP/1.1 the pool is sized to
+    # `concurrency` so no keep-alive connection gets discarded.
+    sem = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(
+        http2=HTTP2,
+        headers=DEFAULT_HEADERS,
+        timeout=timeout,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+    ) as client:
+        async def bounded(u):
+            async with sem:
+                print(f'Crawling {u} ...')
+                try:
+                    return u, await crawl_url_async(client, u, executor)
+                except Exception as e:
+                    return u, e
+
+        for fut in asyncio.as_completed([bounded(u) for u in urls]):
+            yield await fut
+
+
+def _crawl_one(u, session):
+    print(f'Crawling {u} ...')
+    return crawl_url(u, session)
+
+
+def crawl_all_threaded(urls, workers=20):
+    # threads release the GIL while blocked on the network; they share one
+    # requests session whose pool is sized to the worker count so no
+    # keep-alive connection gets discarded
+    workers = min(workers, len(urls))
+    with make_session(workers) as session, ThreadPoolExecutor(max_workers=workers) as ex:
+        futs = {ex.submit(_crawl_one, u, session): u for u in urls}
+        for fut in as_completed(futs):
+            u = futs.pop(fut)
+            try:
+                yield u, fut.result()
+            except Exception as e:
+                yield u, e
+
+
+def positive_int(value):
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f'must be at least 1, got {n}')
+    return n
+
+
+def write_result(fh, u, res):
+    if isinstance(res, Exception):
+        print(f'Error crawling {u}: {res}')
+        res = {'error': str(res)}
+    # lines arrive in completion order and 'url' is the post-redirect URL,
+    # so tag each one with the URL it was requested as
+    fh.write(orjson.dumps({'input_url': u, **res}) + b'\n')
+    # flush per line so a partial file is usable and `tail -f` works
+    fh.flush()
+
+
+async def _crawl_to_file(urls, fh, concurrency):
+    # parse in worker processes so lxml work runs on all cores. The pool
+    # starts after asyncio's resolver threads are running, so don't fork:
+    # workers only need to import parse_html. Windows only offers spawn
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    ctx = multiprocessing.get_context(method)
+    with ProcessPoolExecutor(mp_context=ctx) as executor:
+        async for u, res in crawl_all(urls, concurrency, executor=executor):
+            write_result(fh, u, res)
+
 
 def main():
     p = argparse.ArgumentParser()
     p.add_argument('urls', nargs='*', help='One or more URLs')
     p.add_argument('--input', '-i', help='File with URLs, one per line')
-    p.add_argument('--output', '-o', help='Output JSON file', default='results/output.json')
+    p.add_argument('--output', '-o', help='Output JSON Lines file (appended to)', default='results/output.jsonl')
+    p.add_argument('--concurrency', '-c', type=positive_int, default=20, help='Max concurrent requests')
+    p.add_argument('--threads', action='store_true', help='Use a thread pool instead of asyncio/httpx')
     args = p.parse_args()
 
     urls = []
@@ -24,19 +117,14 @@ def main():
     if not urls:
         p.error('No URLs provided')
 
-    results = []
-    for u in urls:
-        try:
-            print(f'Crawling {u} ...')
-            res = crawl_url(u)
-            results.append(res)
-        except Exception as e:
-            print(f'Error crawling {u}: {e}')
-            results.append({'url': u, 'error': str(e)})
-
     outp = Path(args.output)
     outp.parent.mkdir(parents=True, exist_ok=True)
-    outp.write_text(json.dumps(results, indent=2), encoding='utf-8')
+    with outp.open('ab') as fh:
+        if args.threads or httpx is None:
+            for u, res in crawl_all_threaded(urls, args.concurrency):
+                write_result(fh, u, res)
+        else:
+            asyncio.run(_crawl_to_file(urls, fh, args.concurrency))
     print('Saved', outp)
 
 
@@ -4,11 +4,24 @@ This module provides functions to fetch a URL, parse the DOM while skipping
 hidden/script/style/template content, and extract social links, emails,
 phones, and name candidates using DOM heuristics only.
 """
-from bs4 import BeautifulSoup, Comment
+import asyncio
+import codecs
+import functools
+import os
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
 from urllib.parse import urljoin, urlparse
 import phonenumbers
+import lxml.html
+from lxml import etree
+
+try:
+    import re2
+except ImportError:  # google-re2 is optional
+    re2 = None
 
 SOCIAL_DOMAINS = [
     "linkedin.com",
@@ -23,159 +36,326 @@ SOCIAL_DOMAINS = [
     "wa.me",
 ]
 
-EMAIL_RE = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
-# Very permissive phone-like regex: +country optional, digits, spaces, punctuation
-PHONE_RE = re.compile(r"(\+\d{1,3}[\s\-\.]*)?(?:\(?\d{2,4}\)?[\s\-\.]*)?\d[\d\s\-\.]{6,20}\d")
+# Patterns run over untrusted page text use RE2 (linear time, no backtracking)
+# when google-re2 is installed; set CONTACT_CRAWLER_RE2=0 to force stdlib re.
+_scan_re = re2 if re2 is not None and os.environ.get('CONTACT_CRAWLER_RE2', '1') != '0' else re
 
 
-def fetch_html(url, timeout=15):
-    headers = {"User-Agent": "contact-crawler/1.0 (+https://example)"}
-    r = requests.get(url, headers=headers, timeout=timeout)
-    r.raise_for_status()
-    return r.text, r.url
+def _scan_compile(pattern):
+    # RE2's \d and \s are ASCII-only, while stdlib re's match any Unicode
+    # digit/space in str patterns. Spell out the stdlib classes so both
+    # engines find the same matches (e.g. Arabic-Indic digits, NBSP). The
+    # \s replacement is class contents, so \s may only appear inside [...].
+    if _scan_re is re2:
+        pattern = pattern.replace(r"\d", r"\p{Nd}").replace(r"\s", r"\t\n\x0b\f\r\x1c-\x1f\x85\p{Z}")
+    return _scan_re.compile(pattern)
 
 
-def _is_hidden(elem):
-    # Check inline style and aria-hidden and hidden attribute
-    if not elem:
-        return False
-    # walk up parents
-    for el in elem.parents if hasattr(elem, 'parents') else []:
-        if getattr(el, 'name', None) == 'template':
-            return True
-        try:
-            style = el.get('style', '') or ''
-            if 'display:none' in style.replace(' ', '').lower():
-                return True
-        except Exception:
-            pass
-        if el.get('aria-hidden') == 'true':
-            return True
-        if el.has_attr('hidden'):
-            return True
-    # also check self
-    try:
-        style = elem.get('style', '') or ''
-        if 'display:none' in style.replace(' ', '').lower():
-            return True
-    except Exception:
-        pass
-    if elem.get('aria-hidden') == 'true':
-        return True
-    if elem.has_attr('hidden'):
+EMAIL_RE = _scan_compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
+# Very permissive phone-like regex: +country optional, digits, spaces, punctuation
+PHONE_RE = _scan_compile(r"(\+\d{1,3}[\s\-\.]*)?(?:\(?\d{2,4}\)?[\s\-\.]*)?\d[\d\s\-\.]{6,20}\d")
+# one alternation over SOCIAL_DOMAINS; matched against the lowercased href
+_SOCIAL_RE = _scan_compile('|'.join(re.escape(d) for d in SOCIAL_DOMAINS))
+_DIGITS_RE = re.compile(r"\D")
+_WS_RE = re.compile(r"\s+")
+# class/id keywords that suggest an element holds a person's name, in the
+# priority order used for reasons and candidate order
+_NAME_KEYS = ('name', 'author', 'contact', 'founder', 'ceo', 'person')
+_NAME_KEY_RE = re.compile('|'.join(_NAME_KEYS), re.I | re.A)
+_CHARSET_RE = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.I)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset", re.I)
+_DISPLAY_NONE_RE = re.compile(r"display\s*:\s*none", re.I)
+_TITLE_SPLIT_RE = re.compile(r"[|\-–—]\s*")
+
+
+USER_AGENT = "contact-crawler/1.0 (+https://example)"
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml;q=0.9",
+}
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+# bodies larger than this are not worth parsing for contact details
+MAX_BODY_BYTES = 5 * 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
+NO_CONTACTS_NOTE = 'no contact items found (page may be JS-heavy or require interaction)'
+
+
+def make_session(pool_size=20):
+    # shared session so consecutive hits on a host reuse the TCP/TLS connection
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = make_session()
+
+
+def _is_html(content_type):
+    # a missing Content-Type gets the benefit of the doubt
+    ctype = content_type.split(';', 1)[0].strip().lower()
+    return not ctype or ctype in HTML_CONTENT_TYPES
+
+
+def _too_large(url):
+    return ValueError(f'response body for {url} exceeds {MAX_BODY_BYTES} bytes')
+
+
+def fetch_html(url, timeout=15, session=None):
+    # Returns (body, final_url, content_type). Non-HTML bodies are not
+    # downloaded, and bodies over MAX_BODY_BYTES are aborted. session
+    # defaults to the module-wide pooled one.
+    session = session or _SESSION
+    with session.get(url, timeout=timeout, stream=True) as r:
+        r.raise_for_status()
+        ctype = r.headers.get('Content-Type', '')
+        if not _is_html(ctype):
+            return b'', r.url, ctype
+        chunks = []
+        size = 0
+        for chunk in r.iter_content(_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise _too_large(url)
+            chunks.append(chunk)
+        return b''.join(chunks), r.url, ctype
+
+
+async def fetch_html_async(client, url):
+    # client is an httpx.AsyncClient; headers, timeout and redirects are set on it
+    async with client.stream('GET', url) as r:
+        r.raise_for_status()
+        ctype = r.headers.get('Content-Type', '')
+        if not _is_html(ctype):
+            return b'', str(r.url), ctype
+        chunks = []
+        size = 0
+        async for chunk in r.aiter_bytes(_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise _too_large(url)
+            chunks.append(chunk)
+        return b''.join(chunks), str(r.url), ctype
+
+
+def _hides_itself(el):
+    # inline display:none, aria-hidden or the hidden attribute; structural
+    # hides (template/script/...) are already gone via _strip_noise
+    style = el.get('style')
+    if style and _DISPLAY_NONE_RE.search(style):
         return True
-    return False
+    return el.get('aria-hidden') == 'true' or el.get('hidden') is not None
 
 
-def _visible_texts(soup):
-    # Remove script/style/template and comments
-    for s in soup(['script', 'style', 'noscript', 'iframe']):
-        s.extract()
-    # remove comments
-    for comment in soup.find_all(text=lambda text: isinstance(text, Comment)):
-        comment.extract()
-
+def _is_hidden(elem, cache=None):
+    # Check elem and its ancestors. cache maps element -> hidden and is shared
+    # across calls for one page, so each ancestor chain is only walked once.
+    if elem is None:
+        return False
+    if cache is None:
+        cache = {}
+    chain = []
+    hidden = False
+    el = elem
+    while el is not None:
+        if el in cache:
+            hidden = cache[el]
+            break
+        chain.append(el)
+        if _hides_itself(el):
+            hidden = True
+            break
+        el = el.getparent()
+    for el in chain:
+        cache[el] = hidden
+    return hidden
+
+
+def _text_of(elem):
+    # like BeautifulSoup's get_text(separator=' ', strip=True)
+    return ' '.join(t.strip() for t in elem.itertext() if t.strip())
+
+
+# XPath queries compiled once at import rather than on every call
+_TEXT_XP = etree.XPath('//text()')
+_ANCHORS_XP = etree.XPath('//a[@href]')
+_META_AUTHOR_XP = etree.XPath('(//meta[@name="author"])[1]')
+_TITLE_XP = etree.XPath('(//title)[1]')
+_HEADINGS_XP = etree.XPath('//h1|//h2|//h3|//h4')
+_ATTR_XP = {'class': etree.XPath('//*[@class]'), 'id': etree.XPath('//*[@id]')}
+
+_parser_local = threading.local()
+
+
+def _html_parser(encoding=None):
+    # Comments, PIs and whitespace-only text are never used by the extractors,
+    # so drop them while parsing instead of keeping them in the tree. lxml
+    # parsers must not be shared between threads; keep one per thread and
+    # encoding (None lets lxml sniff <meta charset>).
+    parsers = getattr(_parser_local, 'parsers', None)
+    if parsers is None:
+        parsers = _parser_local.parsers = {}
+    parser = parsers.get(encoding)
+    if parser is None:
+        parser = parsers[encoding] = lxml.html.HTMLParser(
+            encoding=encoding,
+            remove_blank_text=True,
+            remove_comments=True,
+            remove_pis=True,
+            collect_ids=False,
+        )
+    return parser
+
+
+def _prepare_body(html, content_type):
+    # lxml only sniffs <meta charset> and otherwise reads bytes as Latin-1, so
+    # settle the encoding here: the Content-Type charset wins, then a <meta>
+    # declaration (left to lxml), then UTF-8. Returns (body, parser encoding).
+    if isinstance(html, str):
+        # already decoded by the caller (e.g. a prefetched response .text)
+        return html.encode('utf-8'), 'utf-8'
+    m = _CHARSET_RE.search(content_type)
+    if m:
+        try:
+            codec = codecs.lookup(m.group(1)).name
+        except LookupError:
+            codec = None
+        if codec == 'utf-8':
+            return html, 'utf-8'
+        if codec:
+            return html.decode(codec, errors='replace').encode('utf-8'), 'utf-8'
+    if _META_CHARSET_RE.search(html, 0, 4096):
+        return html, None
+    return html, 'utf-8'
+
+
+def _strip_noise(tree):
+    # Remove template/script/style etc. in place, keeping the tail text that
+    # follows them
+    etree.strip_elements(tree, 'template', 'script', 'style', 'noscript', 'iframe', with_tail=False)
+
+
+def _visible_texts(tree, hidden_cache=None):
+    # read-only: call _strip_noise first
     texts = []
-    for elem in soup.find_all(text=True):
-        parent = elem.parent
-        if parent and parent.name in ['script', 'style', 'template']:
+    for elem in _TEXT_XP(tree):
+        parent = elem.getparent()
+        if elem.is_tail:
+            parent = parent.getparent()
+        if parent is None:
             continue
         # strip and ignore empty
-        txt = elem.string
-        if not txt:
-            continue
-        txt = txt.strip()
+        txt = elem.strip()
         if not txt:
             continue
         # skip if hidden by inline rules or ancestors
-        if _is_hidden(parent):
+        if _is_hidden(parent, hidden_cache):
             continue
         texts.append((parent, txt))
     return texts
 
 
-def extract_socials(soup, base_url):
+def _split_anchors(tree):
+    # one pass over every <a href>, bucketed into (links, mailto, tel)
+    links, mailto, tel = [], [], []
+    for a in _ANCHORS_XP(tree):
+        href_lower = a.get('href').lower()
+        if href_lower.startswith('mailto:'):
+            mailto.append(a)
+        elif href_lower.startswith('tel:'):
+            tel.append(a)
+        else:
+            links.append(a)
+    return links, mailto, tel
+
+
+def extract_socials(tree, base_url, link_anchors=None):
+    if link_anchors is None:
+        link_anchors = _split_anchors(tree)[0]
     found = []
-    for a in soup.find_all('a'):
-        href = a.get('href')
+    # visible text may contain link, but we require href for social.
+    # Nav links repeat a lot, so each distinct href is only looked at once.
+    for href in dict.fromkeys(a.get('href') for a in link_anchors):
         if not href:
-            # visible text may contain link, but we require href for social
             continue
         href_lower = href.lower()
-        # normalize
-        full = urljoin(base_url, href)
-        for dom in SOCIAL_DOMAINS:
-            if dom in href_lower:
-                # avoid JS or mailto
-                if href_lower.startswith('javascript:'):
-                    continue
-                found.append(full)
-                break
+        # avoid JS links
+        if _SOCIAL_RE.search(href_lower) and not href_lower.startswith('javascript:'):
+            # normalize; absolute links need no urljoin parse
+            if href.startswith(('http://', 'https://')):
+                found.append(href)
+            else:
+                found.append(urljoin(base_url, href))
     # dedupe while preserving order
-    seen = set()
-    out = []
-    for u in found:
-        if u in seen:
-            continue
-        seen.add(u)
-        out.append(u)
-    return out
-
-
-def extract_emails(soup):
-    emails = set()
+    return list(dict.fromkeys(found))
+
+
+def extract_emails(tree, visible=None, hidden_cache=None, mailto_anchors=None):
+    if hidden_cache is None:
+        hidden_cache = {}
+    if visible is None:
+        visible = _visible_texts(tree, hidden_cache)
+    if mailto_anchors is None:
+        mailto_anchors = _split_anchors(tree)[1]
+    # dict as an insertion-ordered set: results keep page order
+    emails = {}
     # mailto
-    for a in soup.find_all('a'):
-        href = a.get('href', '')
-        if href.lower().startswith('mailto:'):
-            addr = href.split(':', 1)[1].split('?')[0]
-            addr = addr.strip()
-            if EMAIL_RE.match(addr):
-                if not _is_hidden(a):
-                    emails.add(addr)
+    for a in mailto_anchors:
+        href = a.get('href')
+        addr = href.split(':', 1)[1].split('?')[0]
+        addr = addr.strip()
+        if EMAIL_RE.match(addr):
+            if not _is_hidden(a, hidden_cache):
+                emails[addr] = None
     # visible text
-    for parent, txt in _visible_texts(soup):
+    for parent, txt in visible:
         for m in EMAIL_RE.findall(txt):
-            emails.add(m)
-    return list(sorted(emails))
-
-
-def extract_phones(soup):
-    phones = []
-    seen = set()
+            emails[m] = None
+    return list(emails)
+
+
+def extract_phones(tree, visible=None, hidden_cache=None, tel_anchors=None):
+    if hidden_cache is None:
+        hidden_cache = {}
+    if visible is None:
+        visible = _visible_texts(tree, hidden_cache)
+    if tel_anchors is None:
+        tel_anchors = _split_anchors(tree)[2]
+    # keyed by the original string, which is what we dedupe on
+    phones = {}
     # tel: links
-    for a in soup.find_all('a'):
-        href = a.get('href', '')
-        if href.lower().startswith('tel:'):
-            num = href.split(':', 1)[1].split('?')[0]
-            if _is_hidden(a):
-                continue
-            norm = _normalize_phone(num)
-            if num not in seen:
-                phones.append({"original": num, "normalized": norm})
-                seen.add(num)
-    # visible text
-    for parent, txt in _visible_texts(soup):
-        for m in PHONE_RE.findall(txt):
-            # m may be tuple due to groups; get full match by searching
-            match = PHONE_RE.search(txt)
-            if not match:
-                continue
-            num = match.group(0).strip()
-            # clean obvious punctuation
-            if len(re.sub(r"\D", "", num)) < 7:
-                continue
-            if num in seen:
-                continue
-            if _is_hidden(parent):
-                continue
-            norm = _normalize_phone(num)
-            phones.append({"original": num, "normalized": norm})
-            seen.add(num)
-    return phones
+    for a in tel_anchors:
+        href = a.get('href')
+        num = href.split(':', 1)[1].split('?')[0]
+        if _is_hidden(a, hidden_cache):
+            continue
+        if num not in phones:
+            phones[num] = {"original": num, "normalized": _normalize_phone(num)}
+    # visible text, scanned in one pass. PHONE_RE can't match NUL, so
+    # joining on it keeps a match from spanning two text nodes
+    big_text = '\x00'.join(txt for _, txt in visible)
+    for m in PHONE_RE.finditer(big_text):
+        num = m.group(0).strip()
+        # clean obvious punctuation
+        if len(_DIGITS_RE.sub("", num)) < 7:
+            continue
+        if num in phones:
+            continue
+        phones[num] = {"original": num, "normalized": _normalize_phone(num)}
+    return list(phones.values())
 
 
+@functools.lru_cache(maxsize=4096)
 def _normalize_phone(num_str):
+    # no digit-count shortcut here: extensions and default-region national
+    # numbers make raw counts misleading. Free text is already filtered to
+    # 7+ digits in extract_phones; repeats are served by the cache.
     s = num_str.strip()
     try:
         # try parsing with phonenumbers; allow region None so + formats work
@@ -189,11 +369,15 @@ def _normalize_phone(num_str):
     except Exception:
         pass
     # fallback: return digits-only as normalization
-    digits = re.sub(r"\D", "", s)
-    return digits
+    return _DIGITS_RE.sub("", s)
 
 
-def extract_name_candidates(soup):
+def extract_name_candidates(tree, hidden_cache=None, contact_anchors=None):
+    if hidden_cache is None:
+        hidden_cache = {}
+    if contact_anchors is None:
+        _, mailto, tel = _split_anchors(tree)
+        contact_anchors = mailto + tel
     candidates = []
     reasons = []
 
@@ -201,70 +385,70 @@ def extract_name_candidates(soup):
         candidates.append({"name": name.strip(), "confidence": confidence, "reason": reason})
 
     # 1. meta author
-    ma = soup.find('meta', attrs={'name': 'author'})
-    if ma and ma.get('content'):
-        add_candidate(ma.get('content'), 0.9, 'meta[name=author]')
+    for ma in _META_AUTHOR_XP(tree):
+        if ma.get('content'):
+            add_candidate(ma.get('content'), 0.9, 'meta[name=author]')
 
     # 2. page title
-    title = soup.title.string if soup.title and soup.title.string else None
+    title = next((t.text for t in _TITLE_XP(tree)), None)
     if title:
         # sometimes title contains site - try to split by | or -
-        parts = re.split(r"[|\-–—]\s*", title)
+        parts = _TITLE_SPLIT_RE.split(title)
         if parts:
             add_candidate(parts[0], 0.5, 'title (first part)')
 
     # 3. headings near contact info: look for h1..h3, or nodes with class/id name/author/contact
     # find elements that contain an email or phone nearby (same parent)
     contact_nodes = set()
-    for a in soup.find_all('a'):
-        href = a.get('href', '')
-        if href.lower().startswith('mailto:') or href.lower().startswith('tel:'):
-            contact_nodes.add(a.parent)
+    for a in contact_anchors:
+        contact_nodes.add(a.getparent())
 
     # search for headings
-    for tag in ['h1', 'h2', 'h3', 'h4']:
-        for h in soup.find_all(tag):
-            if _is_hidden(h):
-                continue
-            text = h.get_text(separator=' ', strip=True)
-            if not text:
-                continue
-            # base confidence on tag
-            base = 0.7 if tag == 'h1' else 0.6
-            # if heading is sibling/parent of contact node, boost confidence
-            boosted = False
-            for cn in contact_nodes:
-                try:
-                    if cn and (cn == h.parent or cn in h.parents or h in cn.parents):
-                        add_candidate(text, min(0.95, base + 0.25), f'{tag} near contact')
-                        boosted = True
-                        break
-                except Exception:
-                    pass
-            if not boosted:
-                add_candidate(text, base, tag)
-
-    # 4. look for items with common class/id names
-    keys = ['name', 'author', 'contact', 'founder', 'ceo', 'person']
-    for k in keys:
-        for el in soup.find_all(attrs={'class': re.compile(k, re.I)}):
-            if _is_hidden(el):
-                continue
-            text = el.get_text(separator=' ', strip=True)
-            if text and len(text) < 60:
-                add_candidate(text, 0.75, f'class contains {k}')
-        for el in soup.find_all(attrs={'id': re.compile(k, re.I)}):
-            if _is_hidden(el):
+    for h in _HEADINGS_XP(tree):
+        tag = h.tag
+        if _is_hidden(h, hidden_cache):
+            continue
+        text = _text_of(h)
+        if not text:
+            continue
+        # base confidence on tag
+        base = 0.7 if tag == 'h1' else 0.6
+        # if heading is sibling/parent of contact node, boost confidence
+        boosted = False
+        for cn in contact_nodes:
+            if cn is not None and (cn == h.getparent() or cn in h.iterancestors() or h in cn.iterancestors()):
+                add_candidate(text, min(0.95, base + 0.25), f'{tag} near contact')
+                boosted = True
+                break
+        if not boosted:
+            add_candidate(text, base, tag)
+
+    # 4. look for items with common class/id names. One pass per attribute;
+    # each element is bucketed under its highest-priority keyword so reasons
+    # and order match a per-keyword scan (class then id for each keyword)
+    buckets = {k: ([], []) for k in _NAME_KEYS}
+    for i, attr in enumerate(('class', 'id')):
+        for el in _ATTR_XP[attr](tree):
+            value = el.get(attr)
+            if not _NAME_KEY_RE.search(value):
                 continue
-            text = el.get_text(separator=' ', strip=True)
-            if text and len(text) < 60:
-                add_candidate(text, 0.8, f'id contains {k}')
+            value = value.lower()
+            k = next(k for k in _NAME_KEYS if k in value)
+            buckets[k][i].append(el)
+    for k, per_attr in buckets.items():
+        for (attr, confidence), els in zip((('class', 0.75), ('id', 0.8)), per_attr):
+            for el in els:
+                if _is_hidden(el, hidden_cache):
+                    continue
+                text = _text_of(el)
+                if text and len(text) < 60:
+                    add_candidate(text, confidence, f'{attr} contains {k}')
 
     # dedupe by normalized name
     seen = set()
     out = []
     for c in sorted(candidates, key=lambda x: -x['confidence']):
-        n = ' '.join(c['name'].split())
+        n = _WS_RE.sub(' ', c['name']).strip()
         if not n or n in seen:
             continue
         seen.add(n)
@@ -272,21 +456,50 @@ def extract_name_candidates(soup):
     return out
 
 
-def crawl_url(url):
-    html, final = fetch_html(url)
-    soup = BeautifulSoup(html, 'lxml')
-    # remove templates early
-    for t in soup.find_all('template'):
-        t.extract()
+def _empty_result(final, note):
+    return {
+        'url': final,
+        'socials': [],
+        'emails': [],
+        'phones': [],
+        'name_candidates': [],
+        'notes': [note],
+    }
+
 
-    socials = extract_socials(soup, final)
-    emails = extract_emails(soup)
-    phones = extract_phones(soup)
-    names = extract_name_candidates(soup)
+def parse_html(html, final, content_type=''):
+    if not _is_html(content_type):
+        return _empty_result(final, f'non-html content-type: {content_type}')
+    if not html or html.isspace():
+        # lxml refuses an empty document; it simply has no contacts
+        return _empty_result(final, NO_CONTACTS_NOTE)
+    # html is the raw body (bytes, decoded per the header/meta charset) or
+    # text the caller already decoded
+    body, encoding = _prepare_body(html, content_type)
+    try:
+        tree = lxml.html.document_fromstring(body, parser=_html_parser(encoding))
+    except etree.ParserError:
+        # 'Document is empty': nothing left once comments/PIs are dropped,
+        # e.g. a bare <!DOCTYPE html> or <!-- ... -->
+        return _empty_result(final, NO_CONTACTS_NOTE)
+    except etree.LxmlError as e:
+        # lxml errors carry an error log that can't be pickled back from a
+        # ProcessPoolExecutor worker; re-raise something that can
+        raise ValueError(str(e)) from None
+    _strip_noise(tree)
+
+    hidden_cache = {}
+    # visible text is shared by the email and phone extractors
+    visible = _visible_texts(tree, hidden_cache)
+    links, mailto, tel = _split_anchors(tree)
+    socials = extract_socials(tree, final, links)
+    emails = extract_emails(tree, visible, hidden_cache, mailto)
+    phones = extract_phones(tree, visible, hidden_cache, tel)
+    names = extract_name_candidates(tree, hidden_cache, mailto + tel)
 
     notes = []
     if not emails and not phones and not socials:
-        notes.append('no contact items found (page may be JS-heavy or require interaction)')
+        notes.append(NO_CONTACTS_NOTE)
 
     return {
         'url': final,
@@ -298,6 +511,19 @@ def crawl_url(url):
     }
 
 
+def crawl_url(url, session=None):
+    html, final, ctype = fetch_html(url, session=session)
+    return parse_html(html, final, ctype)
+
+
+async def crawl_url_async(client, url, executor=None):
+    html, final, ctype = await fetch_html_async(client, url)
+    # parsing is CPU-bound; keep it off the event loop. Pass a
+    # ProcessPoolExecutor to parse pages on several cores.
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, parse_html, html, final, ctype)
+
+
 if __name__ == '__main__':
     import sys
     u = sys.argv[1]